@@ -1,3 +1,4 @@
+from gzip import GzipFile
 from io import BytesIO
 
 from nbtlib import CompoundSchema, File, schema
@@ -125,18 +126,26 @@ class BedrockLevelFile(File, CompoundSchema):
         return self
 
     def write(self, buff, byteorder="little"):
-        tmp = BytesIO()
-        super().write(tmp, byteorder)
-        tmp.seek(0)
-        data = tmp.read()
-
         write_numeric(INT, self.version, buff, byteorder)
-        write_numeric(INT, len(data), buff, byteorder)
-        buff.write(data)
 
-    @classmethod
-    def from_buffer(cls, buff, byteorder="little"):
-        return super().from_buffer(buff, byteorder)
+        if not buff.seekable() or isinstance(buff, GzipFile):
+            tmp = BytesIO()
+            super().write(tmp, byteorder)
+            data = tmp.getbuffer()
+
+            write_numeric(INT, len(data), buff, byteorder)
+            buff.write(data)
+            return
+
+        # Write a placeholder length and patch it once the payload is written
+        length_position = buff.tell()
+        write_numeric(INT, 0, buff, byteorder)
+        super().write(buff, byteorder)
+        end_position = buff.tell()
+
+        buff.seek(length_position)
+        write_numeric(INT, end_position - length_position - 4, buff, byteorder)
+        buff.seek(end_position)
 
     @classmethod
     def load(cls, filename, gzipped=False, byteorder="little"):
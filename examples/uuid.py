@@ -2,17 +2,21 @@ from uuid import UUID
 
 from nbtlib import Long
 
+LONG_BITS = Long.bits
+LONG_MASK = Long.mask
+long_from_unsigned = Long.from_unsigned
+
 
 def combine_uuid(uuid_most_tag, uuid_least_tag):
     uuid_most = uuid_most_tag.as_unsigned
     uuid_least = uuid_least_tag.as_unsigned
-    return UUID(int=uuid_most << Long.bits | uuid_least)
+    return UUID(int=uuid_most << LONG_BITS | uuid_least)
 
 
 def split_uuid(uuid):
-    uuid_most = uuid.int >> Long.bits & Long.mask
-    uuid_least = uuid.int & Long.mask
-    return Long.from_unsigned(uuid_most), Long.from_unsigned(uuid_least)
+    uuid_most = uuid.int >> LONG_BITS & LONG_MASK
+    uuid_least = uuid.int & LONG_MASK
+    return long_from_unsigned(uuid_most), long_from_unsigned(uuid_least)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,8 @@
 from argparse import ArgumentParser, ArgumentTypeError
-from json import dumps as json_dumps
-from pprint import pprint
+from math import isfinite
 
 from nbtlib import InvalidLiteral, Path, nbt, parse_nbt, serialize_tag
-from nbtlib.tag import Compound, find_tag
+from nbtlib.tag import Compound
 
 # Validation helper
 
@@ -38,6 +37,9 @@ parser.add_argument("--compact", action="store_true", help="output compact snbt"
 parser.add_argument("--pretty", action="store_true", help="output indented snbt")
 parser.add_argument("--unpack", action="store_true", help="output interpreted nbt")
 parser.add_argument("--json", action="store_true", help="output nbt as json")
+parser.add_argument(
+    "--orjson", action="store_true", help="output nbt as json using orjson"
+)
 parser.add_argument("--path", metavar="<path>", help="output all the matching tags")
 parser.add_argument(
     "--find", metavar="<path>", help="recursively find the first matching tag"
@@ -54,19 +56,26 @@ def main():
     gzipped, byteorder = not args.plain, "little" if args.little else "big"
     try:
         if args.r or args.s:
-            for tag in read(
-                args.file, gzipped, byteorder, args.s, args.path, args.find
-            ):
-                if args.w:
-                    write(tag, args.w, gzipped, byteorder)
-                elif args.m:
-                    merge(tag, args.m, gzipped, byteorder)
-                else:
-                    display(tag, args.compact, args.pretty, args.unpack, args.json)
+            tags = read(args.file, gzipped, byteorder, args.s, args.path, args.find)
+            if args.m:
+                merge(list(tags), args.m, gzipped, byteorder)
+            else:
+                for tag in tags:
+                    if args.w:
+                        write(tag, args.w, gzipped, byteorder)
+                    else:
+                        display(
+                            tag,
+                            args.compact,
+                            args.pretty,
+                            args.unpack,
+                            args.json,
+                            args.orjson,
+                        )
         elif args.w:
             write(nbt_data(args.w), args.file, gzipped, byteorder)
         elif args.m:
-            merge(nbt_data(args.m), args.file, gzipped, byteorder)
+            merge([nbt_data(args.m)], args.file, gzipped, byteorder)
         else:
             parser.error("one of the following arguments is required: -r -s -w -m")
     except (ArgumentTypeError, IOError) as exc:
@@ -75,7 +84,7 @@ def main():
 
 def read(filename, gzipped, byteorder, snbt, path, find):
     if snbt:
-        with open(filename) as f:
+        with open(filename, encoding="utf-8") as f:
             nbt_file = parse_nbt(f.read())
     else:
         nbt_file = nbt.load(filename, gzipped=gzipped, byteorder=byteorder)
@@ -89,23 +98,57 @@ def read(filename, gzipped, byteorder, snbt, path, find):
             yield tag
 
 
-def display(tag, compact, pretty, unpack, json):
+def display(tag, compact, pretty, unpack, json, orjson=False):
     if unpack:
+        from pprint import pprint
+
         if pretty:
             pprint(tag.unpack())
         else:
             print(tag.unpack())
-    elif json:
-        print(json_dumps(tag.unpack(json=True), indent=4 if pretty else None))
+    elif json or orjson:
+        print(json_dumps(tag.unpack(json=True), pretty, orjson))
     else:
         print(serialize_tag(tag, indent=4 if pretty else None, compact=compact))
 
 
+def json_dumps(data, pretty, use_orjson):
+    if use_orjson:
+        try:
+            import orjson
+        except ImportError:
+            raise ArgumentTypeError("--orjson requires the orjson package") from None
+
+        # orjson would silently turn infinite and nan values into null
+        if is_finite(data):
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            return orjson.dumps(data, option=option).decode()
+
+    from json import dumps
+
+    return dumps(data, indent=4 if pretty else None)
+
+
+def is_finite(data):
+    if isinstance(data, float):
+        return isfinite(data)
+    if isinstance(data, dict):
+        data = data.values()
+    elif not isinstance(data, list):
+        return True
+    return all(map(is_finite, data))
+
+
 def write(nbt_data, filename, gzipped, byteorder):
     nbt.File(nbt_data).save(filename, gzipped=gzipped, byteorder=byteorder)
 
 
-def merge(nbt_data, filename, gzipped, byteorder):
+def merge(tags, filename, gzipped, byteorder):
+    if not tags:
+        return
+
+    # Load and save the target file only once for all the merged tags
     nbt_file = nbt.load(filename, gzipped=gzipped, byteorder=byteorder)
-    nbt_file.merge(nbt_data)
+    for nbt_data in tags:
+        nbt_file.merge(nbt_data)
     nbt_file.save()
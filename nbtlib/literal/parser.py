@@ -17,6 +17,7 @@ __all__ = ["parse_nbt", "InvalidLiteral", "tokenize", "Parser"]
 
 import re
 from collections import namedtuple
+from threading import Lock
 
 from .serializer import STRING_QUOTES, ESCAPE_SEQUENCES, ESCAPE_SUBS
 from ..tag import (
@@ -41,6 +42,17 @@ from ..tag import (
 
 ESCAPE_REGEX = re.compile(r"\\.")
 
+# Escape sequences that are valid inside strings delimited by each quote
+
+QUOTED_ESCAPE_SEQUENCES = {
+    quote: {
+        seq: sub
+        for seq, sub in ESCAPE_SEQUENCES.items()
+        if seq != ESCAPE_SUBS[STRING_QUOTES[quote]]
+    }
+    for quote in STRING_QUOTES
+}
+
 TOKENS = {
     "QUOTED_STRING": "|".join(
         fr"{q}(?:{ESCAPE_REGEX.pattern}|[^\\])*?{q}" for q in STRING_QUOTES
@@ -56,20 +68,32 @@ TOKENS = {
     "CLOSE_BRACKET": r"\]",
     "COLON": r":",
     "COMMA": r",",
-    "INVALID": r".+?",
+    "INVALID": r"\S+?",
 }
 
 
 # Build the regex
 
 TOKENS_REGEX = re.compile(
-    "|".join(fr"\s*(?P<{key}>{value})\s*" for key, value in TOKENS.items())
+    r"\s*(?:" + "|".join(fr"(?P<{key}>{value})" for key, value in TOKENS.items()) + ")"
 )
 
 
-# Associate number suffixes to tag types
+# Punctuation that can be matched without going through the regex
+
+SINGLE_CHAR_TOKENS = {
+    "{": "COMPOUND",
+    "}": "CLOSE_COMPOUND",
+    "]": "CLOSE_BRACKET",
+    ":": "COLON",
+    ",": "COMMA",
+}
+
+
+# Associate number suffixes to tag types, in both cases
 
 NUMBER_SUFFIXES = {"b": Byte, "s": Short, "l": Long, "f": Float, "d": Double}
+NUMBER_SUFFIXES.update({key.upper(): value for key, value in NUMBER_SUFFIXES.items()})
 
 
 # Define literal aliases
@@ -80,6 +104,35 @@ LITERAL_ALIASES = {
 }
 
 
+# Tags are immutable so the ones created for repeated literals can be shared,
+# and repeated escaped strings like compound keys only need to be unescaped once.
+# Only short literals are cached to avoid keeping large strings alive.
+
+LITERAL_CACHE_SIZE = 4096
+LITERAL_CACHE_MAX_LENGTH = 32
+LITERAL_CACHE_LOCK = Lock()
+
+NUMBER_CACHE = {}
+STRING_CACHE = {}
+UNQUOTE_CACHE = {}
+
+
+def cache_literal(cache, key, value):
+    """Add a value to a literal cache and evict the oldest entry when full.
+
+    Keys longer than ``LITERAL_CACHE_MAX_LENGTH`` are not cached. The
+    caches are shared between threads so they're only modified while
+    holding a lock. Lookups don't need it.
+    """
+    if len(key) > LITERAL_CACHE_MAX_LENGTH:
+        return value
+    with LITERAL_CACHE_LOCK:
+        if len(cache) >= LITERAL_CACHE_SIZE:
+            cache.pop(next(iter(cache)), None)
+        cache[key] = value
+    return value
+
+
 # Custom errors
 
 
@@ -101,13 +154,15 @@ class InvalidLiteral(ValueError):
 
 def parse_nbt(literal):
     """Parse a literal nbt string and return the resulting tag."""
-    parser = Parser(tokenize(literal))
+    parser = Parser(iter_tokens(literal))
     tag = parser.parse()
 
     cursor = parser.token_span[1]
-    leftover = literal[cursor:]
+    leftover = literal[cursor:].lstrip()
 
-    if leftover.strip():
+    if leftover:
+        # Token spans exclude whitespace so report the first leftover character
+        cursor = len(literal) - len(leftover)
         parser.token_span = cursor, cursor + len(leftover)
         raise parser.error(f"Expected end of string but got {leftover!r}")
 
@@ -121,8 +176,30 @@ Token = namedtuple("Token", ["type", "value", "span"])
 
 def tokenize(string):
     """Match and yield all the tokens of the input string."""
-    for match in TOKENS_REGEX.finditer(string):
-        yield Token(match.lastgroup, match.group().strip(), match.span())
+    yield from map(Token._make, iter_tokens(string))
+
+
+def iter_tokens(string):
+    """Match and yield all the tokens of the input string as plain tuples.
+
+    The parser only unpacks the tokens so it avoids creating namedtuples.
+    """
+    position = 0
+
+    while True:
+        token_type = SINGLE_CHAR_TOKENS.get(string[position : position + 1])
+        if token_type:
+            yield token_type, string[position], (position, position + 1)
+            position += 1
+            continue
+
+        match = TOKENS_REGEX.match(string, position)
+        if not match:
+            return
+
+        token_type = match.lastgroup
+        yield token_type, match.group(token_type), match.span(token_type)
+        position = match.end()
 
 
 # Implement parser
@@ -138,9 +215,19 @@ class Parser:
     an invalid nbt literal while parsing.
     """
 
+    __slots__ = (
+        "token_stream",
+        "current_token",
+        "token_type",
+        "token_value",
+        "token_span",
+    )
+
     def __init__(self, token_stream):
         self.token_stream = iter(token_stream)
         self.current_token = None
+        self.token_type = None
+        self.token_value = None
         self.token_span = (0, 0)
 
         self.next()
@@ -155,74 +242,97 @@ class Parser:
         if self.current_token is None:
             self.token_span = self.token_span[1], self.token_span[1]
             raise self.error("Unexpected end of input")
-        self.token_span = self.current_token.span
+        self.token_type, self.token_value, self.token_span = self.current_token
         return self
 
     def parse(self):
         """Parse and return an nbt literal from the token stream."""
-        token_type = self.current_token.type.lower()
-        handler = getattr(self, f"parse_{token_type}", None)
+        handler = self.handlers.get(self.token_type)
         if handler is None:
-            raise self.error(f"Invalid literal {self.current_token.value!r}")
-        return handler()
+            raise self.error(f"Invalid literal {self.token_value!r}")
+        return handler(self)
 
     def parse_quoted_string(self):
         """Parse a quoted string from the token stream."""
-        return String(self.unquote_string(self.current_token.value))
+        value = self.token_value
+        tag = STRING_CACHE.get(value)
+        if tag is None:
+            tag = cache_literal(STRING_CACHE, value, String(self.unquote_string(value)))
+        return tag
 
     def parse_number(self):
         """Parse a number from the token stream."""
-        value = self.current_token.value
-        suffix = value[-1].lower()
+        value = self.token_value
+        tag = NUMBER_CACHE.get(value)
+        if tag is not None:
+            return tag
+
+        tag_type = NUMBER_SUFFIXES.get(value[-1])
 
         try:
-            if suffix in NUMBER_SUFFIXES:
-                return NUMBER_SUFFIXES[suffix](value[:-1])
-            return Double(value) if "." in value else Int(value)
+            if tag_type:
+                tag = tag_type(value[:-1])
+            else:
+                tag = Double(value) if "." in value else Int(value)
         except (OutOfRange, ValueError):
-            return String(value)
+            tag = String(value)
+
+        return cache_literal(NUMBER_CACHE, value, tag)
 
     def parse_string(self):
         """Parse a regular unquoted string from the token stream."""
-        aliased_value = LITERAL_ALIASES.get(self.current_token.value.lower())
+        value = self.token_value
+        aliased_value = LITERAL_ALIASES.get(value.lower())
         if aliased_value is not None:
             return aliased_value
-        return String(self.current_token.value)
+
+        tag = STRING_CACHE.get(value)
+        if tag is None:
+            tag = cache_literal(STRING_CACHE, value, String(value))
+        return tag
 
     def collect_tokens_until(self, token_type):
         """Yield the item tokens in a comma-separated tag collection."""
         self.next()
-        if self.current_token.type == token_type:
+        if self.token_type == token_type:
             return
 
         while True:
             yield self.current_token
 
             self.next()
-            if self.current_token.type == token_type:
+            if self.token_type == token_type:
                 return
 
-            if self.current_token.type != "COMMA":
-                raise self.error(f"Expected comma but got {self.current_token.value!r}")
+            if self.token_type != "COMMA":
+                raise self.error(f"Expected comma but got {self.token_value!r}")
             self.next()
 
     def parse_compound(self):
         """Parse a compound from the token stream."""
         compound_tag = Compound()
+        if self.next().token_type == "CLOSE_COMPOUND":
+            return compound_tag
 
-        for token in self.collect_tokens_until("CLOSE_COMPOUND"):
-            item_key = token.value
-            if token.type not in ("NUMBER", "STRING", "QUOTED_STRING"):
+        while True:
+            token_type, item_key = self.token_type, self.token_value
+            if token_type not in ("NUMBER", "STRING", "QUOTED_STRING"):
                 raise self.error(f"Expected compound key but got {item_key!r}")
 
-            if token.type == "QUOTED_STRING":
+            if token_type == "QUOTED_STRING":
                 item_key = self.unquote_string(item_key)
 
-            if self.next().current_token.type != "COLON":
-                raise self.error(f"Expected colon but got {self.current_token.value!r}")
+            if self.next().token_type != "COLON":
+                raise self.error(f"Expected colon but got {self.token_value!r}")
             self.next()
             compound_tag[item_key] = self.parse()
-        return compound_tag
+
+            if self.next().token_type == "CLOSE_COMPOUND":
+                return compound_tag
+
+            if self.token_type != "COMMA":
+                raise self.error(f"Expected comma but got {self.token_value!r}")
+            self.next()
 
     def array_items(self, number_type, *, number_suffix=""):
         """Parse and yield array items from the token stream."""
@@ -233,24 +343,64 @@ class Parser:
                 raise self.error(f"Invalid {number_type} array element {token.value!r}")
             yield int(value.replace(number_suffix, ""))
 
+    def parse_array(self, array_type, number_type, *, number_suffix=""):
+        """Parse array items from the token stream directly into an array tag."""
+        if self.next().token_type == "CLOSE_BRACKET":
+            return array_type()
+
+        suffix_length = len(number_suffix)
+        items = []
+
+        while True:
+            token_value = self.token_value
+            value = token_value[: len(token_value) - suffix_length]
+            suffix = token_value[len(value) :].lower()
+            try:
+                if self.token_type != "NUMBER" or suffix != number_suffix:
+                    raise ValueError
+                items.append(int(value))
+            except ValueError:
+                raise self.error(
+                    f"Invalid {number_type} array element {token_value!r}"
+                ) from None
+
+            if self.next().token_type == "CLOSE_BRACKET":
+                return array_type(items)
+
+            if self.token_type != "COMMA":
+                raise self.error(f"Expected comma but got {self.token_value!r}")
+            self.next()
+
     def parse_byte_array(self):
         """Parse a byte array from the token stream."""
-        return ByteArray(list(self.array_items("byte", number_suffix="b")))
+        return self.parse_array(ByteArray, "byte", number_suffix="b")
 
     def parse_int_array(self):
         """Parse an int array from the token stream."""
-        return IntArray(list(self.array_items("int")))
+        return self.parse_array(IntArray, "int")
 
     def parse_long_array(self):
         """Parse a long array from the token stream."""
-        return LongArray(list(self.array_items("long", number_suffix="l")))
+        return self.parse_array(LongArray, "long", number_suffix="l")
 
     def parse_list(self):
         """Parse a list from the token stream."""
+        if self.next().token_type == "CLOSE_BRACKET":
+            return List()
+
+        items = []
+        while True:
+            items.append(self.parse())
+
+            if self.next().token_type == "CLOSE_BRACKET":
+                break
+
+            if self.token_type != "COMMA":
+                raise self.error(f"Expected comma but got {self.token_value!r}")
+            self.next()
+
         try:
-            return List(
-                [self.parse() for _ in self.collect_tokens_until("CLOSE_BRACKET")]
-            )
+            return List(items)
         except IncompatibleItemType as exc:
             raise self.error(
                 f"Item {str(exc.item)!r} is not a {exc.subtype.__name__} tag"
@@ -258,20 +408,38 @@ class Parser:
 
     def parse_invalid(self):
         """Parse an invalid token from the token stream."""
-        raise self.error(f"Invalid token {self.current_token.value!r}")
+        raise self.error(f"Invalid token {self.token_value!r}")
 
     def unquote_string(self, string):
         """Return the unquoted value of a quoted string."""
         value = string[1:-1]
-
-        forbidden_sequences = {ESCAPE_SUBS[STRING_QUOTES[string[0]]]}
-        valid_sequences = set(ESCAPE_SEQUENCES) - forbidden_sequences
-
-        for seq in ESCAPE_REGEX.findall(value):
-            if seq not in valid_sequences:
-                raise self.error(f'Invalid escape sequence "{seq}"')
-
-        for seq, sub in ESCAPE_SEQUENCES.items():
-            value = value.replace(seq, sub)
-
-        return value
+        if "\\" not in value:
+            return value
+
+        unquoted = UNQUOTE_CACHE.get(string)
+        if unquoted is not None:
+            return unquoted
+
+        valid_sequences = QUOTED_ESCAPE_SEQUENCES[string[0]]
+
+        def unescape(match):
+            sub = valid_sequences.get(match.group())
+            if sub is None:
+                raise self.error(f'Invalid escape sequence "{match.group()}"')
+            return sub
+
+        return cache_literal(UNQUOTE_CACHE, string, ESCAPE_REGEX.sub(unescape, value))
+
+    # Map token types to the method that parses the corresponding tag
+
+    handlers = {
+        "QUOTED_STRING": parse_quoted_string,
+        "NUMBER": parse_number,
+        "STRING": parse_string,
+        "COMPOUND": parse_compound,
+        "BYTE_ARRAY": parse_byte_array,
+        "INT_ARRAY": parse_int_array,
+        "LONG_ARRAY": parse_long_array,
+        "LIST": parse_list,
+        "INVALID": parse_invalid,
+    }
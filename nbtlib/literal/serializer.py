@@ -40,10 +40,50 @@ ESCAPE_SEQUENCES[r"\\"] = "\\"
 
 ESCAPE_SUBS = dict(reversed(tuple(map(reversed, ESCAPE_SEQUENCES.items()))))
 
+# Translation tables escaping backslashes and the quote delimiting the string
+
+ESCAPE_TABLES = {
+    quote: str.maketrans(
+        {
+            match: seq
+            for match, seq in ESCAPE_SUBS.items()
+            if match == quote or match not in STRING_QUOTES
+        }
+    )
+    for quote in STRING_QUOTES
+}
+
 
 # Detect if a compound key can be represented unquoted
 
-UNQUOTED_COMPOUND_KEY = re.compile(r"^[a-zA-Z0-9._+-]+$")
+UNQUOTED_COMPOUND_KEY_CHARS = (
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._+-"
+)
+
+# Translation table deleting every character allowed in unquoted keys
+
+UNQUOTED_COMPOUND_KEY_TABLE = str.maketrans("", "", UNQUOTED_COMPOUND_KEY_CHARS)
+
+
+# Remember which tag types are expanded when nested in an indented tag
+
+NESTED_EXPANSION = {}
+
+
+def expands_when_nested(tag_type):
+    """Return whether instances of the tag type are expanded when nested."""
+    expand = NESTED_EXPANSION.get(tag_type)
+    if expand is None:
+        expand = NESTED_EXPANSION[tag_type] = tag_type.serializer == "compound" or (
+            tag_type.serializer == "list"
+            and tag_type.subtype.serializer in ("array", "list", "compound")
+        )
+    return expand
+
+
+# Remember how to format each numeric tag type
+
+NUMERIC_FORMATS = {}
 
 
 # User-friendly helper
@@ -61,6 +101,10 @@ def serialize_tag(tag, *, indent=None, compact=False, quote=None):
 class Serializer:
     """Nbt tag serializer."""
 
+    # Cache the method that serializes each tag type, per serializer class
+
+    handlers = {}
+
     def __init__(self, *, indent=None, compact=False, quote=None):
         self.indentation = indent * " " if isinstance(indent, int) else indent
         self.comma = "," if compact else ", "
@@ -72,6 +116,10 @@ class Serializer:
 
         self.quote = quote
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.handlers = {}
+
     @contextmanager
     def depth(self):
         """Increase the level of indentation by one."""
@@ -87,18 +135,9 @@ class Serializer:
 
     def should_expand(self, tag):
         """Return whether the specified tag should be expanded."""
-        return (
-            self.indentation is not None
-            and tag
-            and (
-                not self.previous_indent
-                or (
-                    tag.serializer == "list"
-                    and tag.subtype.serializer in ("array", "list", "compound")
-                )
-                or (tag.serializer == "compound")
-            )
-        )
+        if self.indentation is None or not tag:
+            return False
+        return not self.previous_indent or expands_when_nested(type(tag))
 
     def expand(self, separator, fmt):
         """Return the expanded version of the separator and format string."""
@@ -115,33 +154,38 @@ class Serializer:
             found = QUOTE_REGEX.search(string)
             quote = STRING_QUOTES[found.group()] if found else next(iter(STRING_QUOTES))
 
-        for match, seq in ESCAPE_SUBS.items():
-            if match == quote or match not in STRING_QUOTES:
-                string = string.replace(match, seq)
-
-        return f"{quote}{string}{quote}"
+        return f"{quote}{string.translate(ESCAPE_TABLES[quote])}{quote}"
 
     def stringify_compound_key(self, key):
         """Escape the compound key if it can't be represented unquoted."""
-        if UNQUOTED_COMPOUND_KEY.match(key):
+        if key and not key.translate(UNQUOTED_COMPOUND_KEY_TABLE):
             return key
         return self.escape_string(key)
 
     def serialize(self, tag):
         """Return the literal representation of a tag."""
-        handler = getattr(self, f"serialize_{tag.serializer}", None)
+        handler = self.handlers.get(type(tag))
         if handler is None:
-            raise TypeError(f"Can't serialize {type(tag)!r} instance")
-        return handler(tag)
+            handler = getattr(type(self), f"serialize_{tag.serializer}", None)
+            if handler is None:
+                raise TypeError(f"Can't serialize {type(tag)!r} instance")
+            self.handlers[type(tag)] = handler
+        return handler(self, tag)
 
     def serialize_numeric(self, tag):
         """Return the literal representation of a numeric tag."""
-        str_func = int.__repr__ if isinstance(tag, int) else float.__repr__
-        return str_func(tag) + tag.suffix
+        numeric_format = NUMERIC_FORMATS.get(type(tag))
+        if numeric_format is None:
+            str_func = int.__repr__ if isinstance(tag, int) else float.__repr__
+            numeric_format = NUMERIC_FORMATS[type(tag)] = str_func, tag.suffix
+
+        str_func, suffix = numeric_format
+        return str_func(tag) + suffix
 
     def serialize_array(self, tag):
         """Return the literal representation of an array tag."""
-        elements = self.comma.join(map(serialize_tag, tag)).upper()
+        suffix = tag.wrapper.suffix.upper()
+        elements = self.comma.join([f"{item}{suffix}" for item in tag.tolist()])
         return f"[{tag.array_prefix}{self.semicolon}{elements}]"
 
     def serialize_string(self, tag):
@@ -150,25 +194,27 @@ class Serializer:
 
     def serialize_list(self, tag):
         """Return the literal representation of a list tag."""
-        separator, fmt = self.comma, "[{}]"
-
         with self.depth():
             if self.should_expand(tag):
-                separator, fmt = self.expand(separator, fmt)
+                separator, fmt = self.expand(self.comma, "[{}]")
+            else:
+                separator, fmt = self.comma, None
 
-            return fmt.format(separator.join(map(self.serialize, tag)))
+            items = separator.join([self.serialize(item) for item in tag])
+            return fmt.format(items) if fmt else f"[{items}]"
 
     def serialize_compound(self, tag):
         """Return the literal representation of a compound tag."""
-        separator, fmt = self.comma, "{{{}}}"
-
         with self.depth():
             if self.should_expand(tag):
-                separator, fmt = self.expand(separator, fmt)
+                separator, fmt = self.expand(self.comma, "{{{}}}")
+            else:
+                separator, fmt = self.comma, None
 
-            return fmt.format(
-                separator.join(
+            items = separator.join(
+                [
                     f"{self.stringify_compound_key(key)}{self.colon}{self.serialize(value)}"
                     for key, value in tag.items()
-                )
+                ]
             )
+            return fmt.format(items) if fmt else f"{{{items}}}"
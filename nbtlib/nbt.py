@@ -53,13 +53,23 @@ by using the ``gzipped`` and ``byteorder`` arguments respectively.
 """
 
 
-__all__ = ["load", "File"]
+__all__ = ["load", "load_many", "File"]
 
 
-import gzip
+import io
 
 from .tag import BYTE, Compound, read_numeric, read_string, write_numeric, write_string
 
+# Size of the buffer used when reading files, large enough to keep the number
+# of system calls low when the data goes through gzip
+
+READ_BUFFER_SIZE = 128 * 1024
+
+# Default compression level for gzipped files. The gzip module defaults to 9,
+# which is a lot slower for output that is barely smaller
+
+GZIP_COMPRESS_LEVEL = 6
+
 
 def load(filename, *, gzipped=None, byteorder="big"):
     """Load the nbt file at the specified location.
@@ -119,16 +129,51 @@ def load(filename, *, gzipped=None, byteorder="big"):
     if gzipped is not None:
         return File.load(filename, gzipped, byteorder)
 
-    # Read the magic number otherwise and call `File.from_fileobj` with
-    # the appropriate file object
-    with open(filename, "rb") as fileobj:
-        magic_number = fileobj.read(2)
-        fileobj.seek(0)
+    # Peek at the magic number otherwise and call `File.from_fileobj` with
+    # the appropriate file object. Peeking fills the read buffer without
+    # moving the cursor so the header doesn't need to be read again.
+    with open(filename, "rb", buffering=READ_BUFFER_SIZE) as fileobj:
+        magic_number = fileobj.peek(2)[:2]
+
+        if magic_number != b"\x1f\x8b":
+            return File.from_fileobj(fileobj, byteorder, gzipped=False)
+
+        import gzip
 
-        if magic_number == b"\x1f\x8b":
-            fileobj = gzip.GzipFile(fileobj=fileobj)
+        return File.from_fileobj(
+            gzip.GzipFile(fileobj=fileobj), byteorder, gzipped=True
+        )
 
-        return File.from_fileobj(fileobj, byteorder)
+
+def load_many(filenames, *, gzipped=None, byteorder="big", max_workers=None):
+    """Load several nbt files concurrently and return them in order.
+
+    .. doctest::
+
+        >>> filenames = ["docs/hello_world.nbt", "docs/bigtest.nbt"]
+        >>> [nbt_file.root_name for nbt_file in nbtlib.load_many(filenames)]
+        ['hello world', 'Level']
+
+    The files are loaded with :func:`load` in a thread pool. Reading
+    and decompressing the files release the GIL, so gzipped files can
+    be decompressed while other files are being parsed.
+
+    Arguments:
+        gzipped: Forwarded to :func:`load` for every file.
+        byteorder: Forwarded to :func:`load` for every file.
+        max_workers: The maximum number of threads used to load the files.
+            Uses the ``concurrent.futures.ThreadPoolExecutor`` default if
+            the argument is not specified.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers) as executor:
+        return list(
+            executor.map(
+                lambda filename: load(filename, gzipped=gzipped, byteorder=byteorder),
+                filenames,
+            )
+        )
 
 
 class File(Compound):
@@ -237,7 +282,7 @@ class File(Compound):
         super().write(fileobj, byteorder)
 
     @classmethod
-    def from_fileobj(cls, fileobj, byteorder="big"):
+    def from_fileobj(cls, fileobj, byteorder="big", *, gzipped=None):
         """Load an nbt file from a proper file object.
 
         The method is used by the :func:`load` helper function when the
@@ -250,15 +295,60 @@ class File(Compound):
                 data. The function simply calls the inherited
                 :meth:`nbtlib.tag.Compound.parse` classmethod and sets the
                 :attr:`filename` and :attr:`gzipped` attributes depending
-                on the argument.
+                on the argument. Gzipped data is decompressed in one go
+                and parsed from memory.
 
             byteorder:
                 Can be either ``"big"`` or ``"little"``. The argument is
                 forwarded to :meth:`nbtlib.tag.Compound.parse`.
+
+            gzipped:
+                Whether the file object is a gzip stream. The method checks
+                the type of the file object if the argument is not specified.
         """
-        self = cls.parse(fileobj, byteorder)
+        if gzipped is None:
+            import gzip
+
+            gzipped = isinstance(fileobj, gzip.GzipFile)
+
+        # Parsing issues lots of tiny reads that are much cheaper on an
+        # in-memory buffer than on the decompression stream
+        self = cls.parse(io.BytesIO(fileobj.read()) if gzipped else fileobj, byteorder)
         self.filename = getattr(fileobj, "name", self.filename)
-        self.gzipped = isinstance(fileobj, gzip.GzipFile)
+        self.gzipped = gzipped
+        self.byteorder = byteorder
+        return self
+
+    @classmethod
+    def from_bytes(cls, data, byteorder="big"):
+        """Load an nbt file from a bytes-like object.
+
+        .. doctest::
+
+            >>> fileobj = io.BytesIO()
+            >>> nbtlib.File({"counter": nbtlib.Int(0)}).write(fileobj)
+            >>> nbtlib.File.from_bytes(fileobj.getvalue())
+            <File '': {'counter': Int(0)}>
+
+        Arguments:
+            data:
+                The binary nbt data, for instance an nbt payload extracted
+                from a larger file. The data is decompressed first if it
+                starts with the gzip magic number, and the :attr:`gzipped`
+                attribute is set accordingly.
+
+            byteorder:
+                Can be either ``"big"`` or ``"little"``. The argument is
+                forwarded to :meth:`nbtlib.tag.Compound.parse`.
+        """
+        gzipped = data[:2] == b"\x1f\x8b"
+        if gzipped:
+            import gzip
+
+            data = gzip.decompress(data)
+
+        self = cls.parse(io.BytesIO(data), byteorder)
+        self.gzipped = gzipped
         self.byteorder = byteorder
         return self
 
@@ -276,11 +366,21 @@ class File(Compound):
             gzipped: Whether the file is gzipped or not.
             byteorder: Can be either ``"big"`` or ``"little"``.
         """
-        open_file = gzip.open if gzipped else open
-        with open_file(filename, "rb") as fileobj:
-            return cls.from_fileobj(fileobj, byteorder)
-
-    def save(self, filename=None, *, gzipped=None, byteorder=None):
+        with open(filename, "rb", buffering=READ_BUFFER_SIZE) as fileobj:
+            if gzipped:
+                import gzip
+
+                fileobj = gzip.GzipFile(fileobj=fileobj)
+            return cls.from_fileobj(fileobj, byteorder, gzipped=bool(gzipped))
+
+    def save(
+        self,
+        filename=None,
+        *,
+        gzipped=None,
+        byteorder=None,
+        compresslevel=GZIP_COMPRESS_LEVEL,
+    ):
         """Write the file at the specified location.
 
         The method is called without any argument at the end of ``with``
@@ -298,6 +398,7 @@ class File(Compound):
             filename: The name of the file. Defaults to the instance's :attr:`filename` attribute.
             gzipped: Whether the file should be gzipped. Defaults to the instance's :attr:`gzipped` attribute.
             byteorder: Whether the file should be big-endian or little-endian. Defaults to the instance's :attr:`byteorder` attribute.
+            compresslevel: The gzip compression level, from 0 to 9. Defaults to 6 like zlib and Minecraft itself.
         """
         if gzipped is None:
             gzipped = self.gzipped
@@ -307,9 +408,20 @@ class File(Compound):
         if filename is None:
             raise ValueError("No filename specified")
 
-        open_file = gzip.open if gzipped else open
-        with open_file(filename, "wb") as fileobj:
-            self.write(fileobj, byteorder or self.byteorder)
+        # Serialize the tags in memory first and write everything at once
+        data = io.BytesIO()
+        self.write(data, byteorder or self.byteorder)
+
+        with open(filename, "wb") as fileobj:
+            if gzipped:
+                import gzip
+
+                with gzip.GzipFile(
+                    fileobj=fileobj, mode="wb", compresslevel=compresslevel
+                ) as gzip_file:
+                    gzip_file.write(data.getbuffer())
+            else:
+                fileobj.write(data.getbuffer())
 
     def __enter__(self):
         return self
@@ -10,10 +10,17 @@ __all__ = ["Path", "InvalidPath", "NamedKey", "ListIndex", "CompoundMatch"]
 
 
 import re
+from functools import lru_cache
 from typing import NamedTuple, Optional
 
-from .tag import Int, String, Array, List, Compound
-from .literal.parser import Parser, tokenize, InvalidLiteral
+from .tag import Numeric, Int, String, Array, List, Compound
+from .literal.parser import Parser, iter_tokens, InvalidLiteral, LITERAL_ALIASES
+
+
+# Paths made only of unquoted keys and list indices don't need the snbt parser
+
+SIMPLE_PATH_REGEX = re.compile(r"(?:[a-zA-Z0-9_.]|\[(?:-?[0-9]+)?\])*")
+SIMPLE_PATH_TOKENS_REGEX = re.compile(r"([a-zA-Z0-9_.]+)|\[(-?[0-9]*)\]")
 
 
 class InvalidPath(ValueError):
@@ -34,38 +41,39 @@ class Path(tuple):
             return cls.from_accessors()
 
         if isinstance(path, Path):
-            return cls.from_accessors(path)
+            # Paths are immutable so there's no need to copy them
+            return path if type(path) is cls else cls.from_accessors(path)
 
         if isinstance(path, int):
             # Handle an integer x as if the string "[x]" were just parsed
-            return cls.from_accessors((ListIndex(index=int(path)),))
-
-        accessors = ()
-        for accessor in parse_accessors(path):
-            accessors = extend_accessors(accessors, accessor)
+            return cls.from_accessors((list_index(int(path)),))
 
-        return cls.from_accessors(accessors)
+        return cls.from_accessors(parse_path(path))
 
     def __getitem__(self, key):
         if isinstance(key, Path):
             new_accessors = tuple(key)
         elif isinstance(key, str):
-            new_accessors = (NamedKey(key),)
+            new_accessors = (named_key(key),)
         elif isinstance(key, int):
-            new_accessors = (ListIndex(index=int(key)),)
+            new_accessors = (list_index(int(key)),)
         elif isinstance(key, slice) and all(
             n is None for n in [key.start, key.stop, key.step]
         ):
-            new_accessors = (ListIndex(index=None),)
+            new_accessors = (list_index(None),)
         elif isinstance(key, Compound):
             new_accessors = (CompoundMatch(key),)
         else:
             raise KeyError(key)
 
-        accessors = tuple(self)
+        # Only compound matches need to be merged with the previous accessor
+        if not isinstance(key, (Path, Compound)):
+            return self.from_accessors(tuple.__add__(self, new_accessors))
+
+        accessors = list(self)
 
         for accessor in new_accessors:
-            accessors = extend_accessors(accessors, accessor)
+            extend_accessors(accessors, accessor)
 
         return self.from_accessors(accessors)
 
@@ -102,22 +110,31 @@ class Path(tuple):
     def from_accessors(cls, accessors=()):
         return super().__new__(cls, accessors)
 
-    def traverse(self, tag):
+    def select(self, tag):
         tags = [(None, tag)]
 
-        setter = None
-        deleter = None
-
         for accessor in self:
-            setter = getattr(accessor, "set", setter)
-            deleter = getattr(accessor, "delete", deleter)
-
             tags = accessor.get(tags)
 
-        return tags, setter, deleter
+        return tags
+
+    def last_accessor_method(self, name):
+        # Path overrides __getitem__ so index the underlying tuple directly
+        for i in range(len(self) - 1, -1, -1):
+            method = getattr(tuple.__getitem__(self, i), name, None)
+            if method:
+                return method
+        return None
+
+    def traverse(self, tag):
+        return (
+            self.select(tag),
+            self.last_accessor_method("set"),
+            self.last_accessor_method("delete"),
+        )
 
     def get(self, tag):
-        return [tag for _, tag in self.traverse(tag)[0]]
+        return [tag for _, tag in self.select(tag)]
 
     def set(self, tag, value):
         tags, setter, _ = self.traverse(tag)
@@ -135,24 +152,37 @@ class Path(tuple):
         return f"{self.__class__.__name__}({str(self)!r})"
 
     def __str__(self):
-        segments = [""]
+        # Paths matching compounds can't be hashed so they're not cached
+        if any(isinstance(accessor, CompoundMatch) for accessor in self):
+            return stringify_path.__wrapped__(self)
+        return stringify_path(self)
 
-        for accessor in self:
-            segment = str(accessor)
 
-            if not segment or segment.startswith("["):
-                segments[-1] += segment
+@lru_cache(maxsize=4096)
+def stringify_path(path):
+    """Return the string representation of a path.
+
+    The result is cached for paths that get printed or compared repeatedly,
+    as long as they don't contain any compound, which is mutable.
+    """
+    segments = [""]
+
+    for accessor in path:
+        segment = str(accessor)
 
-            elif segment.startswith("{"):
-                if segments[-1].endswith("[]"):
-                    segments[-1] = segments[-1][:-2] + f"[{segment}]"
-                else:
-                    segments[-1] += segment
+        if not segment or segment.startswith("["):
+            segments[-1] += segment
 
+        elif segment.startswith("{"):
+            if segments[-1].endswith("[]"):
+                segments[-1] = segments[-1][:-2] + f"[{segment}]"
             else:
-                segments.append(segment)
+                segments[-1] += segment
+
+        else:
+            segments.append(segment)
 
-        return ".".join(filter(None, segments))
+    return ".".join(filter(None, segments))
 
 
 def can_be_converted_to_int(string):
@@ -165,9 +195,46 @@ def can_be_converted_to_int(string):
         return False
 
 
+def parse_path(path):
+    """Parse a path string and return the resulting accessors."""
+    if SIMPLE_PATH_REGEX.fullmatch(path):
+        accessors = parse_simple_accessors(path)
+        if accessors is not None:
+            return accessors
+
+    accessors = []
+    for accessor in parse_accessors(path):
+        extend_accessors(accessors, accessor)
+    return tuple(accessors)
+
+
+@lru_cache(maxsize=4096)
+def parse_simple_accessors(path):
+    """Parse a path containing only unquoted keys and list indices.
+
+    Return None when the path needs to go through the snbt parser anyway,
+    which is the case for keys that the parser would turn into literals.
+
+    The result is cached for strings that get parsed repeatedly, like the ones
+    compared against paths or used in loops. Paths with compound matches
+    aren't cached because their compounds are mutable and can't be shared.
+    """
+    accessors = []
+
+    for keys, index in SIMPLE_PATH_TOKENS_REGEX.findall(path):
+        if not keys:
+            accessors.append(list_index(int(index) if index else None))
+        elif keys.lower() in LITERAL_ALIASES:
+            return None
+        else:
+            accessors.extend(named_key(key) for key in keys.split(".") if key)
+
+    return tuple(accessors)
+
+
 def parse_accessors(path):
     try:
-        parser = Parser(tokenize(path))
+        parser = Parser(iter_tokens(path))
     except InvalidLiteral:
         return ()
 
@@ -178,21 +245,21 @@ def parse_accessors(path):
             raise InvalidPath(f"Invalid path at position {exc.args[0][0]}") from exc
 
         if isinstance(tag, String):
-            if parser.current_token.type == "QUOTED_STRING":
-                yield NamedKey(tag[:])
+            if parser.token_type == "QUOTED_STRING":
+                yield named_key(tag[:])
             else:
-                yield from (NamedKey(key) for key in tag.split(".") if key)
+                yield from (named_key(key) for key in tag.split(".") if key)
 
         elif isinstance(tag, List):
             if not tag:
-                yield ListIndex(index=None)
+                yield list_index(None)
             elif len(tag) != 1:
                 raise InvalidPath("Brackets should only contain one element")
             elif issubclass(tag.subtype, Compound):
-                yield ListIndex(index=None)
+                yield list_index(None)
                 yield CompoundMatch(tag[0])
             elif issubclass(tag.subtype, Int) or can_be_converted_to_int(tag[0]):
-                yield ListIndex(int(tag[0]))
+                yield list_index(int(tag[0]))
             else:
                 raise InvalidPath(
                     "Brackets should only contain an integer or a compound"
@@ -201,10 +268,8 @@ def parse_accessors(path):
         elif isinstance(tag, Compound):
             yield CompoundMatch(tag)
 
-        elif parser.current_token.type == "NUMBER":
-            yield from (
-                NamedKey(key) for key in parser.current_token.value.split(".") if key
-            )
+        elif parser.token_type == "NUMBER":
+            yield from (named_key(key) for key in parser.token_value.split(".") if key)
 
         else:
             raise InvalidPath(f"Invalid path element {tag}")
@@ -217,28 +282,52 @@ def parse_accessors(path):
 
 def extend_accessors(accessors, new_accessor):
     if isinstance(new_accessor, CompoundMatch) and accessors:
-        *except_last, last_accessor = accessors
+        last_accessor = accessors[-1]
 
         if isinstance(last_accessor, CompoundMatch):
             new_compound = new_accessor.compound.with_defaults(last_accessor.compound)
-            return tuple(except_last) + (CompoundMatch(new_compound),)
+            accessors[-1] = CompoundMatch(new_compound)
+            return
         if isinstance(last_accessor, ListIndex) and last_accessor.index is not None:
             raise InvalidPath(
                 f"Can't match a compound on list items selected with {last_accessor!r}"
             )
-    return accessors + (new_accessor,)
+    accessors.append(new_accessor)
+
+
+# Sentinel for keys missing from compounds
+
+MISSING = object()
+
+
+# Translation table deleting every character allowed in unquoted keys
+
+UNQUOTED_KEY_TABLE = str.maketrans(
+    "", "", "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_"
+)
 
 
 class NamedKey(NamedTuple):
     key: str
 
-    UNQUOTED_REGEX = re.compile(r"^[a-zA-Z0-9_]+$")
-
     def get(self, tags):
+        key = self.key
+
+        if len(tags) == 1:
+            # Most paths only select a single tag until they reach a list
+            _, tag = tags[0]
+            if isinstance(tag, dict):
+                value = dict.get(tag, key, MISSING)
+                if value is not MISSING:
+                    return [(tag, value)]
+            return []
+
+        # Other tags like strings also support "in" so they must be skipped
         return [
-            (tag, tag[self.key])
+            (tag, value)
             for _, tag in tags
-            if isinstance(tag, dict) and self.key in tag
+            if isinstance(tag, dict)
+            and (value := dict.get(tag, key, MISSING)) is not MISSING
         ]
 
     def set(self, tags, value):
@@ -253,7 +342,7 @@ class NamedKey(NamedTuple):
     def __str__(self):
         return (
             self.key
-            if self.UNQUOTED_REGEX.match(self.key)
+            if self.key and not self.key.translate(UNQUOTED_KEY_TABLE)
             else '"' + self.key.replace('"', '\\"') + '"'
         )
 
@@ -262,15 +351,20 @@ class ListIndex(NamedTuple):
     index: Optional[int]
 
     def get(self, tags):
-        tags = [tag for tag in tags if isinstance(tag[1], (List, Array))]
+        index = self.index
 
-        if self.index is None:
-            return [((tag, i), item) for _, tag in tags for i, item in enumerate(tag)]
+        if index is None:
+            return [
+                ((tag, i), item)
+                for _, tag in tags
+                if isinstance(tag, (List, Array))
+                for i, item in enumerate(tag)
+            ]
 
         return [
-            ((tag, self.index), tag[self.index])
+            ((tag, index), tag[index])
             for _, tag in tags
-            if -len(tag) <= self.index < len(tag)
+            if isinstance(tag, (List, Array)) and -len(tag) <= index < len(tag)
         ]
 
     def set(self, tags, value):
@@ -279,9 +373,24 @@ class ListIndex(NamedTuple):
                 parent[i] = value
 
     def delete(self, tags):
-        for (parent, i), _ in reversed(tags):
-            if self.index is None or i == self.index:
-                del parent[i]
+        if self.index is not None:
+            for (parent, i), _ in reversed(tags):
+                if i == self.index:
+                    del parent[i]
+            return
+
+        # Rebuild each list once instead of shifting the items after every del
+        indices = {}
+        for (parent, i), _ in tags:
+            indices.setdefault(id(parent), (parent, set()))[1].add(i)
+
+        for parent, selected in indices.values():
+            if len(selected) == len(parent):
+                del parent[:]
+            else:
+                # The kept items are already tags of the right type
+                kept = [item for i, item in enumerate(parent) if i not in selected]
+                list.__setitem__(parent, slice(None), kept)
 
     def __str__(self):
         return f'[{"" if self.index is None else self.index}]'
@@ -291,7 +400,61 @@ class CompoundMatch(NamedTuple):
     compound: Compound
 
     def get(self, tags):
-        return [(parent, tag) for parent, tag in tags if tag.match(self.compound)]
+        leaves = compound_leaves(self.compound)
+        return [(parent, tag) for parent, tag in tags if match_leaves(tag, leaves)]
 
     def __str__(self):
         return self.compound.snbt()
+
+
+def compound_leaves(compound, keys=()):
+    """Flatten a compound pattern into a list of (keys, expected value) pairs."""
+    leaves = []
+
+    for key, value in compound.items():
+        if isinstance(value, dict) and value:
+            leaves.extend(compound_leaves(value, keys + (key,)))
+        else:
+            leaves.append((keys + (key,), value))
+
+    return leaves
+
+
+def match_leaves(tag, leaves):
+    """Check whether the tag matches the leaves of a flattened compound pattern.
+
+    This is equivalent to `tag.match(compound)` but doesn't need to walk the
+    pattern again for every tag.
+    """
+    if not isinstance(tag, dict):
+        return False
+
+    for keys, expected in leaves:
+        value = tag
+        for key in keys:
+            if not isinstance(value, dict):
+                return False
+            value = dict.get(value, key, MISSING)
+            if value is MISSING:
+                return False
+
+        if isinstance(expected, (Numeric, String)):
+            if value.tag_id != expected.tag_id or value != expected:
+                return False
+        elif not value.match(expected):
+            return False
+
+    return True
+
+
+# Share accessor instances between paths, most of them use the same few keys
+
+
+@lru_cache(maxsize=4096)
+def named_key(key):
+    return NamedKey(key)
+
+
+@lru_cache(maxsize=4096)
+def list_index(index):
+    return ListIndex(index)
@@ -57,17 +57,22 @@ class CompoundSchema(Compound):
         super().__init__(*args, **kwargs)
         self._strict = strict or self.strict
 
-        for key, value in self.items():
-            correct_value = self.cast_item(key, value)
-            if correct_value is not value:
-                super().__setitem__(key, correct_value)
+        cast_item = self.cast_item
+        cast_values = {
+            key: correct_value
+            for key, value in self.items()
+            if (correct_value := cast_item(key, value)) is not value
+        }
+        if cast_values:
+            super().update(cast_values)
 
     def __setitem__(self, key, value):
         super().__setitem__(key, self.cast_item(key, value))
 
     def update(self, mapping, **kwargs):
+        cast_item = self.cast_item
         pairs = chain(mapping.items(), kwargs.items())
-        super().update((key, self.cast_item(key, value)) for key, value in pairs)
+        super().update({key: cast_item(key, value) for key, value in pairs})
 
     def cast_item(self, key, value):
         """Cast schema item to the appropriate tag type."""
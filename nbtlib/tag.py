@@ -206,6 +206,20 @@ def read_numeric(fmt, fileobj, byteorder="big"):
         raise ValueError("Invalid byte order") from exc
 
 
+def read_numerics(fmt, length, fileobj, byteorder="big"):
+    """Read a sequence of numeric values from a file-like object."""
+    try:
+        fmt = fmt[byteorder]
+    except KeyError as exc:
+        raise ValueError("Invalid byte order") from exc
+
+    # Values that can't be read entirely default to zero like in read_numeric
+    data = fileobj.read(length * fmt.size)
+    count = len(data) // fmt.size
+    sequence = Struct(f"{fmt.format[0]}{count}{fmt.format[1:]}")
+    return sequence.unpack(data[: sequence.size]) + (0,) * (length - count)
+
+
 def write_numeric(fmt, value, fileobj, byteorder="big"):
     """Write a numeric value to a file-like object."""
     try:
@@ -906,7 +920,23 @@ class List(Base, list):
         """Override :meth:`Base.parse` for list tags."""
         tag = cls.get_tag(read_numeric(BYTE, fileobj, byteorder))
         length = read_numeric(INT, fileobj, byteorder)
-        return cls[tag](tag.parse(fileobj, byteorder) for _ in range(length))
+
+        # End.parse doesn't return tags so the items still need to go through
+        # the constructor
+        if tag is End:
+            return cls[tag](tag.parse(fileobj, byteorder) for _ in range(length))
+
+        # Parsed items already have the right type so they don't need to be cast
+        self = cls[tag]()
+
+        # Unpack all the values of numeric lists at once
+        if issubclass(tag, Numeric) and length > 0:
+            items = map(tag, read_numerics(tag.fmt, length, fileobj, byteorder))
+        else:
+            items = (tag.parse(fileobj, byteorder) for _ in range(length))
+
+        list.extend(self, items)
+        return self
 
     def write(self, fileobj, byteorder="big"):
         """Override :meth:`Base.write` for list tags."""
@@ -1030,12 +1060,16 @@ class List(Base, list):
                 conversion fails, the method raises a :class:`CastError`.
         """
         if not isinstance(item, cls.subtype):
-            incompatible = isinstance(item, Base) and not any(
-                issubclass(cls.subtype, tag_type) and isinstance(item, tag_type)
-                for tag_type in cls.all_tags.values()
-            )
-            if incompatible:
-                raise IncompatibleItemType(item, cls.subtype)
+            if isinstance(item, Base):
+                # Tags can only be cast to subclasses of their own tag type
+                tag_type = cls.all_tags.get(item.tag_id)
+                compatible = (
+                    tag_type is not None
+                    and isinstance(item, tag_type)
+                    and issubclass(cls.subtype, tag_type)
+                )
+                if not compatible:
+                    raise IncompatibleItemType(item, cls.subtype)
 
             try:
                 return cls.subtype(item)
@@ -1079,11 +1113,14 @@ class Compound(Base, dict):
     def parse(cls, fileobj, byteorder="big"):
         """Override :meth:`Base.parse` for compound tags."""
         self = cls()
-        tag_id = read_numeric(BYTE, fileobj, byteorder)
-        while tag_id != 0:
+        all_tags = cls.all_tags
+
+        # Tag ids are single bytes so they don't need to go through struct
+        tag_id = fileobj.read(1)
+        while tag_id and tag_id != cls.end_tag:
             name = read_string(fileobj, byteorder)
-            self[name] = cls.get_tag(tag_id).parse(fileobj, byteorder)
-            tag_id = read_numeric(BYTE, fileobj, byteorder)
+            self[name] = all_tags[tag_id[0]].parse(fileobj, byteorder)
+            tag_id = fileobj.read(1)
         return self
 
     def write(self, fileobj, byteorder="big"):
@@ -1200,10 +1237,9 @@ class Compound(Base, dict):
             other: Can be a builtin ``dict`` or an instance of :class:`Compound`.
         """
         for key, value in other.items():
-            if key in self and (
-                isinstance(self[key], Compound) and isinstance(value, dict)
-            ):
-                self[key].merge(value)
+            existing = dict.get(self, key)
+            if isinstance(existing, Compound) and isinstance(value, dict):
+                existing.merge(value)
             else:
                 self[key] = value
 
@@ -294,6 +294,8 @@ invalid_literals = [
     "[[],[],1b]",
     "[[],[],1b]",
     "[L;5l,4l,3]",
+    "[I;1,2b]",
+    "[L;1.5l]",
     "{hello,world}",
     "{with space: 5}",
     '{\\": no}',
@@ -1,6 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from nbtlib import parse_nbt, InvalidLiteral
+from nbtlib import parse_nbt, serialize_tag, InvalidLiteral, Serializer
+from nbtlib.literal.parser import STRING_CACHE, Parser, tokenize
+from nbtlib.tag import Compound, Int
 
 from .inputs import literal_values_for_tags, invalid_literals, nbt_files
 
@@ -24,3 +28,63 @@ def test_parsing_literal_tag_value(nbt_data):
 def test_parsing_invalid_literal(literal):
     with pytest.raises(InvalidLiteral):
         parse_nbt(literal)
+
+
+@pytest.mark.parametrize(
+    "literal, message",
+    [
+        ("1 2", "Expected end of string but got '2' at position 2"),
+        ("{a:1}  }", "Expected end of string but got '}' at position 7"),
+        ("[1b]\n,", "Expected end of string but got ',' at position 5"),
+    ],
+)
+def test_parsing_trailing_content_error(literal, message):
+    with pytest.raises(InvalidLiteral) as exc_info:
+        parse_nbt(literal)
+    assert str(exc_info.value) == message
+
+
+def test_serializer_subclass_override():
+    class UpperSerializer(Serializer):
+        def serialize_string(self, tag):
+            return super().serialize_string(tag.upper())
+
+    tag = parse_nbt('{a: "foo", b: ["bar"]}')
+    assert UpperSerializer().serialize(tag) == '{a: "FOO", b: ["BAR"]}'
+    assert Serializer().serialize(tag) == '{a: "foo", b: ["bar"]}'
+
+
+def test_serializing_key_with_newline():
+    tag = Compound({"a\n": Int(1)})
+    literal = serialize_tag(tag)
+    assert literal == '{"a\n": 1}'
+    assert parse_nbt(literal) == tag
+
+
+def test_tokenize_yields_tokens():
+    tokens = list(tokenize("{a: 1}"))
+    assert [token.type for token in tokens][:2] == ["COMPOUND", "STRING"]
+    assert tokens[1].value == "a" and tokens[1].span == (1, 2)
+    assert Parser(tokenize("{a: [I; 1, 2]}")).parse() == parse_nbt("{a: [I; 1, 2]}")
+
+
+def test_parser_array_items():
+    parser = Parser(tokenize("[B; 1b, 2b]"))
+    assert list(parser.array_items("byte", number_suffix="b")) == [1, 2]
+
+
+def test_long_literals_not_cached():
+    short, long = "short-literal", "long-literal-" * 10
+    parse_nbt(f'[{short}, "{long}"]')
+    assert short in STRING_CACHE
+    assert f'"{long}"' not in STRING_CACHE
+
+
+def test_parsing_from_several_threads():
+    def parse_strings(thread):
+        for batch in range(50):
+            items = ", ".join(f'"{thread}-{batch}-{i}"' for i in range(200))
+            assert len(parse_nbt(f"[{items}]")) == 200
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(parse_strings, range(8)))
@@ -24,6 +24,19 @@ def test_file_compression(file_path, value):
     assert nbt_file.gzipped == value.gzipped
 
 
+@pytest.mark.parametrize("file_path, value", nbt_files)
+def test_file_from_bytes(file_path, value):
+    with open(file_path, "rb") as f:
+        nbt_file = nbt.File.from_bytes(f.read())
+    assert nbt_file == value
+    assert nbt_file.gzipped == value.gzipped
+
+
+def test_load_many():
+    file_paths, values = zip(*nbt_files)
+    assert nbt.load_many(file_paths) == list(values)
+
+
 @pytest.mark.parametrize("file_path, value", nbt_files)
 def test_file_types(file_path, value):
     nbt_file = nbt.load(file_path)
@@ -157,6 +157,7 @@ normalized_path_strings = (
         "a[-3].c{a: [1b, 2b]}.d[].e{a: {e: 5b}}[].d{a: {m: 4.0f}}",
         "Items[].a[]",
         "[{}]",
+        '"newline\n"',
     ]
     + [
         path
@@ -199,3 +200,32 @@ equivalent_path_pairs = [
 @pytest.mark.parametrize("path1, path2", equivalent_path_pairs)
 def test_equivalent_paths(path1, path2):
     assert path1 == path2
+
+
+def test_compound_match_not_shared_between_paths():
+    path = Path("a{b: 1}")
+    tuple(path)[-1].compound["c"] = parse_nbt("2")
+
+    assert str(Path("a{b: 1}")) == "a{b: 1}"
+    assert parse_nbt("{a: {b: 1}}").get_all(Path("a{b: 1}")) == [parse_nbt("{b: 1}")]
+
+
+def test_accessor_type_error_not_swallowed():
+    calls = []
+
+    class BrokenKey:
+        def __str__(self):
+            calls.append(self)
+            raise TypeError("broken accessor")
+
+    with pytest.raises(TypeError, match="broken accessor"):
+        str(Path.from_accessors((BrokenKey(),)))
+    assert len(calls) == 1
+
+
+def test_delete_matching_items_keeps_other_items():
+    tag = parse_nbt("{a: [{b: 1}, {b: 2}, {b: 1}, {c: 3}]}")
+    kept = tag["a"][1]
+    del tag[Path("a[{b: 1}]")]
+    assert tag == parse_nbt("{a: [{b: 2}, {c: 3}]}")
+    assert tag["a"][0] is kept
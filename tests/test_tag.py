@@ -76,3 +76,8 @@ class TestListTagEdgeCases:
     def test_casting_error_without_subtype(self):
         with pytest.raises(CastError):
             List([[5, 4], List([List([])])])
+
+    def test_parsing_end_list_with_length(self):
+        tag = List.parse(BytesIO(b"\x00\x00\x00\x00\x02"))
+        assert tag == List([])
+        assert tag.subtype is End